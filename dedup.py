@@ -0,0 +1,35 @@
+"""
+Title-based deduplication for the major news archive
+
+This module is kept free of third-party imports and fully annotated so it can
+be compiled to a C extension with mypyc (``mypyc dedup.py``). Python picks up
+the compiled module automatically; without it the pure-Python version is used.
+The compiled ``dedup.*.so`` shadows this file, so after editing it either
+rebuild or delete the .so, otherwise the old code keeps running.
+"""
+from typing import Any, Dict, List, Set
+
+
+def add_unique_articles(articles: List[Dict[str, Any]], target: List[Dict[str, Any]],
+                        seen_titles: Set[int], limit: int) -> None:
+    """
+    Append articles with unseen titles to target until it holds limit articles
+    
+    Args:
+        articles: Candidate articles in preference order
+        target: List to append accepted articles to
+        seen_titles: Hashes of normalized titles already accepted; updated in place
+        limit: Stop once target reaches this length
+    """
+    count = len(target)
+    for article in articles:
+        if count >= limit:
+            break
+        title: str = article.get('title', '').strip().lower()
+        if not title:
+            continue
+        key = hash(title)
+        if key not in seen_titles:
+            seen_titles.add(key)
+            target.append(article)
+            count += 1
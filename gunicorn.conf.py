@@ -0,0 +1,22 @@
+"""
+gunicorn configuration for serving the news archive
+
+The archive is built and refreshed by a single thread in the gunicorn master
+process, so workers only serve the CSV file and never rebuild it.
+"""
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '8080')}"
+workers = 4
+worker_class = 'gthread'
+threads = 8
+
+# Import news_fetcher from this directory but keep the caller's cwd, so the
+# master and the workers resolve the same relative CSV_FILENAME
+pythonpath = os.path.dirname(os.path.abspath(__file__))
+
+
+def when_ready(server):
+    """Start the archive refresher once, in the master process"""
+    from news_fetcher import start_background_refresh
+    start_background_refresh()
@@ -1,11 +1,256 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import asyncio
+import csv
 import json
+import operator
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
-import pandas as pd
+from typing import Iterable, List, Dict, Optional
+import hashlib
 import os
+import re
+import shutil
+import threading
+import time
 from flask import Flask, send_file
 
+from dedup import add_unique_articles
+
+try:
+    import aiohttp
+except ImportError:  # async fetching is optional
+    aiohttp = None
+
+try:
+    from requests_cache import CachedSession
+except ImportError:  # responses are then only cached in memory (Reddit listings)
+    CachedSession = None
+
+try:
+    import ahocorasick
+except ImportError:  # keyword matching falls back to a regex
+    ahocorasick = None
+
+# orjson decodes response bytes directly and is several times faster than json
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+# (connect, read) timeout in seconds for all outgoing HTTP requests
+REQUEST_TIMEOUT = (3, 10)
+
+# On-disk HTTP cache shared across runs, with per-host lifetimes
+HTTP_CACHE_NAME = "news_cache.sqlite"
+HTTP_CACHE_EXPIRE_AFTER = timedelta(minutes=10)
+HTTP_CACHE_URLS_EXPIRE_AFTER = {
+    'www.reddit.com': 300,
+    'content.guardianapis.com': 900,
+    'newsapi.org': 300,
+}
+
+# Worker counts for concurrent source fetches and concurrent per-year fetches
+SOURCE_WORKERS = 3
+YEAR_WORKERS = 4
+
+# Maximum number of queries in flight at once when fetching asynchronously
+ASYNC_QUERY_CONCURRENCY = 5
+
+NEWS_API_URL = "https://newsapi.org/v2/everything"
+GUARDIAN_URL = "https://content.guardianapis.com/search"
+REDDIT_URL = "https://www.reddit.com/r/{subreddit}/hot.json"
+
+# Column order of the exported CSV file
+CSV_FIELDNAMES = ['Date', 'Title', 'Source', 'Source Name', 'Description', 'URL']
+
+# Default archive file and how long (seconds) it is served before being regenerated
+CSV_FILENAME = "major_news_2018_to_today.csv"
+CSV_MAX_AGE = 3600
+
+# Seconds clients are told to wait while the first archive is being built
+CSV_RETRY_AFTER = 60
+
+# Seconds before a failed rebuild is retried; doubled after each further
+# failure, up to the refresh interval
+CSV_RETRY_BACKOFF = 60
+
+# gunicorn settings used by serve(); the Procfile passes the same file
+GUNICORN_CONFIG = os.path.join(os.path.dirname(os.path.abspath(__file__)), "gunicorn.conf.py")
+
+# Leading date and time of an ISO-8601 timestamp, e.g. 2024-01-31T12:00:00Z
+_ISO_RE = re.compile(r'(\d{4}-\d{2}-\d{2})T(\d{2}:\d{2}:\d{2})')
+
+# Seconds a subreddit listing is reused before it is fetched again
+REDDIT_CACHE_TTL = 300
+
+# Subreddits polled by fetch_all_news, fetched together as one multireddit
+REDDIT_SUBREDDITS = ["investing", "stocks", "Bitcoin", "CryptoCurrency", "worldnews", "news"]
+REDDIT_MULTI_LIMIT = 100
+
+# The only post fields read from Reddit listings; everything else is dropped
+# before a listing is cached
+REDDIT_POST_FIELDS = ('title', 'selftext', 'url', 'created_utc', 'subreddit', 'score')
+
+# raw_json=1 returns titles and text without HTML entity escaping (&amp; etc.)
+REDDIT_PARAMS = {'raw_json': 1}
+
+# Keywords (lowercase) that mark a Reddit post as investment-related
+INVESTMENT_KEYWORDS = frozenset({'investment', 'funding', 'venture', 'capital', 'startup', 'ipo', 'acquisition', 'merger', 'fund', 'raise', 'bitcoin', 'crypto', 'cryptocurrency', 'btc', 'blockchain', 'stock', 'market', 'economy', 'financial', 'finance'})
+
+# Major news queries covering different categories
+MAJOR_NEWS_QUERIES = [
+    "politics",
+    "economy",
+    "technology",
+    "business",
+    "finance",
+    "world news",
+    "breaking news",
+    "stock market",
+    "cryptocurrency",
+    "climate change",
+    "health",
+    "science",
+    "artificial intelligence",
+    "space",
+    "entertainment",
+    "sports",
+    "environment",
+    "education",
+    "innovation",
+    "global economy"
+]
+
+# Fallback queries used when the archive has fewer than 100 articles
+ADDITIONAL_QUERIES = [
+    "technology news",
+    "business news",
+    "financial news",
+    "world events",
+    "major announcements"
+]
+
+
+def _or_query(queries: List[str]) -> str:
+    """Combine search queries into one boolean OR query for the news APIs"""
+    return "(" + " OR ".join(f'"{query}"' for query in queries) + ")"
+
+
+# Terms NewsAPI searches for alongside every query
+NEWS_API_QUERY_SUFFIX = " OR funding OR venture capital OR startup investment OR M&A OR IPO OR Bitcoin OR cryptocurrency OR stock market OR economy"
+
+# NewsAPI rejects 'q' values longer than this
+NEWS_API_MAX_QUERY_LENGTH = 500
+
+# Each query list is sent as a single OR query, so the Guardian and NewsAPI
+# are called once per date range instead of once per topic. The combined
+# query plus NEWS_API_QUERY_SUFFIX must stay within NEWS_API_MAX_QUERY_LENGTH,
+# otherwise every NewsAPI call fails (and its error entries are filtered out),
+# so the length is checked at import time.
+MAJOR_NEWS_QUERY = _or_query(MAJOR_NEWS_QUERIES)
+ADDITIONAL_QUERY = _or_query(ADDITIONAL_QUERIES)
+
+for _query in (MAJOR_NEWS_QUERY, ADDITIONAL_QUERY):
+    if len(_query + NEWS_API_QUERY_SUFFIX) > NEWS_API_MAX_QUERY_LENGTH:
+        raise ValueError(f"Combined NewsAPI query exceeds {NEWS_API_MAX_QUERY_LENGTH} characters: {_query}")
+del _query
+
+# Sort key for articles; every parsed article carries 'published_at'
+_get_pub = operator.itemgetter('published_at')
+
+
+# Whole-word match of any investment keyword (plurals included) in a lowercased title
+_KEYWORD_RE = re.compile(r'\b(?:' + '|'.join(map(re.escape, sorted(INVESTMENT_KEYWORDS))) + r')s?\b')
+
+
+def _build_keyword_automaton():
+    """Build an Aho-Corasick automaton over INVESTMENT_KEYWORDS, or None without pyahocorasick"""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for keyword in INVESTMENT_KEYWORDS:
+        automaton.add_word(keyword, len(keyword))
+    automaton.make_automaton()
+    return automaton
+
+
+_KEYWORD_AUTOMATON = _build_keyword_automaton()
+
+
+def _is_word_char(char: str) -> bool:
+    """Same notion of a word character as the regex \\w class"""
+    return char.isalnum() or char == '_'
+
+
+def _has_investment_keyword(title: str) -> bool:
+    """
+    Return True if the title contains an investment keyword as a whole word
+    
+    The Aho-Corasick automaton finds every keyword occurrence in one pass over
+    the title; only those hits are checked for word boundaries, matching the
+    regex fallback's semantics (an optional trailing 's' is allowed).
+    """
+    title = title.lower()
+    if _KEYWORD_AUTOMATON is None:
+        return _KEYWORD_RE.search(title) is not None
+    
+    length = len(title)
+    for end, keyword_length in _KEYWORD_AUTOMATON.iter(title):
+        start = end - keyword_length + 1
+        if start > 0 and _is_word_char(title[start - 1]):
+            continue
+        after = end + 1
+        if after < length and title[after] == 's':
+            after += 1
+        if after < length and _is_word_char(title[after]):
+            continue
+        return True
+    return False
+
+
+def _utc_isoformat(timestamps: List[float]) -> List[str]:
+    """Convert Unix timestamps to UTC ISO-8601 strings (YYYY-MM-DDTHH:MM:SS)"""
+    return [time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(ts)) for ts in timestamps]
+
+
+def _prune_reddit_listing(data: Dict) -> Dict:
+    """Keep only REDDIT_POST_FIELDS of each post in a Reddit listing"""
+    children = []
+    for post in data.get('data', {}).get('children', []):
+        post_data = post.get('data', {})
+        children.append({'data': {field: post_data[field] for field in REDDIT_POST_FIELDS if field in post_data}})
+    return {'data': {'children': children}}
+
+
+def _newsapi_to_row(article: Dict) -> Dict:
+    """Convert one NewsAPI article into an article dict"""
+    get = article.get
+    return {
+        'source': 'NewsAPI',
+        'title': get('title', ''),
+        'description': get('description', ''),
+        'url': get('url', ''),
+        'published_at': get('publishedAt', ''),
+        'source_name': get('source', {}).get('name', '')
+    }
+
+
+def _guardian_to_row(article: Dict) -> Dict:
+    """Convert one Guardian search result into an article dict"""
+    get = article.get('fields', {}).get
+    return {
+        'source': 'The Guardian',
+        'title': get('headline', ''),
+        'description': get('trailText', ''),
+        # webUrl is a top-level result property, not a show-fields field
+        'url': article.get('webUrl', ''),
+        'published_at': article.get('webPublicationDate', ''),
+        'source_name': 'The Guardian'
+    }
+
+
 class NewsFetcher:
     def __init__(self, api_key: Optional[str] = None):
         """
@@ -16,6 +261,166 @@ class NewsFetcher:
         """
         self.api_key = api_key
         
+        # Shared session so repeated calls to the same hosts reuse connections
+        self.session = self._create_session()
+        self.session.headers['User-Agent'] = 'NewsFetcher/1.0'
+        retries = Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retries)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        
+        # Raw Reddit listings keyed by (subreddit, limit) -> (fetched_at, data).
+        # Subreddit contents do not depend on the search query, so every query
+        # within the TTL reuses the same listing.
+        self._reddit_cache = {}
+        self._reddit_cache_lock = threading.Lock()
+        self._reddit_fetch_locks = {}
+        # In-flight async listing fetches keyed like _reddit_cache, so concurrent
+        # coroutines share one request instead of each missing the cache
+        self._reddit_async_fetches = {}
+        
+        # Query-based sources used by fetch_all_news, resolved once here so the
+        # common no-key case never dispatches to NewsAPI just to get an error
+        self._search_sources = [self.fetch_guardian]
+        self._async_search_sources = [self.fetch_guardian_async]
+        if api_key:
+            self._search_sources.append(self.fetch_news_api)
+            self._async_search_sources.append(self.fetch_news_api_async)
+    
+    def _create_session(self) -> requests.Session:
+        """
+        Create the HTTP session, backed by an on-disk cache when requests-cache is installed
+        
+        Cached responses are reused across processes for the per-host lifetimes in
+        HTTP_CACHE_URLS_EXPIRE_AFTER, and the last good response is served if a
+        refresh fails (e.g. Reddit rate limiting with 429).
+        """
+        if CachedSession is None:
+            return requests.Session()
+        return CachedSession(
+            HTTP_CACHE_NAME,
+            backend='sqlite',
+            expire_after=HTTP_CACHE_EXPIRE_AFTER,
+            urls_expire_after=HTTP_CACHE_URLS_EXPIRE_AFTER,
+            cache_control=True,
+            stale_if_error=True,
+            # Keep API keys out of cache keys and the cache file
+            ignored_parameters=['apiKey', 'api-key'],
+        )
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def close(self):
+        """Close the underlying HTTP session"""
+        self.session.close()
+    
+    def _news_api_params(self, query: str, language: str, from_date: str = None, to_date: str = None) -> Dict:
+        """Build NewsAPI query parameters"""
+        params = {
+            'q': f"{query}{NEWS_API_QUERY_SUFFIX}",
+            'language': language,
+            'apiKey': self.api_key,
+            'pageSize': 50,
+            'sortBy': 'publishedAt'
+        }
+        
+        # Add date filters if provided
+        if from_date:
+            params['from'] = from_date
+        if to_date:
+            params['to'] = to_date
+        return params
+    
+    def _parse_news_api(self, data: Dict) -> List[Dict]:
+        """Convert a NewsAPI response body into article dicts"""
+        return [_newsapi_to_row(article) for article in data.get('articles', [])]
+    
+    def _guardian_params(self, query: str, from_date: str = None, to_date: str = None) -> Dict:
+        """Build Guardian API query parameters"""
+        params = {
+            'q': f"{query} funding venture capital startup Bitcoin cryptocurrency stock market economy",
+            'show-fields': 'headline,trailText',
+            'api-key': self.api_key if self.api_key else 'test',  # test key works for limited requests
+            'page-size': 50,
+            'section': 'business'
+        }
+        
+        # Add date filters if provided
+        if from_date:
+            params['from-date'] = from_date
+        if to_date:
+            params['to-date'] = to_date
+        return params
+    
+    def _parse_guardian(self, data: Dict) -> List[Dict]:
+        """Convert a Guardian API response body into article dicts"""
+        return [_guardian_to_row(article) for article in data.get('response', {}).get('results', [])]
+    
+    def _get_cached_reddit(self, key) -> Optional[Dict]:
+        """Return a cached Reddit listing if it is younger than REDDIT_CACHE_TTL"""
+        with self._reddit_cache_lock:
+            entry = self._reddit_cache.get(key)
+        if entry and time.monotonic() - entry[0] < REDDIT_CACHE_TTL:
+            return entry[1]
+        return None
+    
+    def _store_cached_reddit(self, key, data: Dict):
+        """Remember a Reddit listing for later queries"""
+        with self._reddit_cache_lock:
+            self._reddit_cache[key] = (time.monotonic(), data)
+    
+    def _fetch_reddit_raw(self, subreddit: str, limit: int) -> Dict:
+        """
+        Fetch the raw hot listing for a subreddit, reusing a cached copy within the TTL
+        
+        Concurrent callers for the same subreddit wait on a per-key lock so only
+        one of them issues the HTTP request.
+        
+        Raises:
+            requests.exceptions.RequestException: If the request fails
+            ValueError: If the response body is not valid JSON
+        """
+        key = (subreddit, limit)
+        data = self._get_cached_reddit(key)
+        if data is not None:
+            return data
+        
+        with self._reddit_cache_lock:
+            fetch_lock = self._reddit_fetch_locks.setdefault(key, threading.Lock())
+        
+        with fetch_lock:
+            data = self._get_cached_reddit(key)
+            if data is None:
+                response = self.session.get(REDDIT_URL.format(subreddit=subreddit), params={**REDDIT_PARAMS, 'limit': limit}, timeout=REQUEST_TIMEOUT)
+                response.raise_for_status()
+                data = _prune_reddit_listing(json_loads(response.content))
+                self._store_cached_reddit(key, data)
+        return data
+    
+    def _parse_reddit(self, data: Dict, subreddit: str) -> List[Dict]:
+        """Convert a Reddit listing into investment-related article dicts"""
+        # Filter for investment-related content
+        posts = [post.get('data', {}) for post in data.get('data', {}).get('children', [])]
+        posts = [post_data for post_data in posts if _has_investment_keyword(post_data.get('title', ''))]
+        
+        # Convert all creation times in one batch
+        published = _utc_isoformat([post_data.get('created_utc', 0) for post_data in posts])
+        
+        return [{
+            'source': 'Reddit',
+            'title': post_data.get('title', ''),
+            'description': post_data.get('selftext', ''),
+            'url': post_data.get('url', ''),
+            'published_at': published_at,
+            # Multireddit listings mix subreddits; each post names its own
+            'source_name': f"r/{post_data.get('subreddit', subreddit)}",
+            'score': post_data.get('score', 0)
+        } for post_data, published_at in zip(posts, published)]
+        
     def fetch_news_api(self, query: str = "investment", language: str = "en", from_date: str = None, to_date: str = None) -> List[Dict]:
         """
         Fetch news from NewsAPI (requires free API key from newsapi.org)
@@ -32,39 +437,14 @@ class NewsFetcher:
         if not self.api_key:
             return [{"error": "API key required for NewsAPI. Get one from newsapi.org"}]
             
-        url = f"https://newsapi.org/v2/everything"
-        params = {
-            'q': f"{query} OR funding OR venture capital OR startup investment OR M&A OR IPO OR Bitcoin OR cryptocurrency OR stock market OR economy",
-            'language': language,
-            'apiKey': self.api_key,
-            'pageSize': 50,
-            'sortBy': 'publishedAt'
-        }
-        
-        # Add date filters if provided
-        if from_date:
-            params['from'] = from_date
-        if to_date:
-            params['to'] = to_date
+        params = self._news_api_params(query, language, from_date, to_date)
         
         try:
-            response = requests.get(url, params=params)
+            response = self.session.get(NEWS_API_URL, params=params, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
-            data = response.json()
+            return self._parse_news_api(json_loads(response.content))
             
-            articles = []
-            for article in data.get('articles', []):
-                articles.append({
-                    'source': 'NewsAPI',
-                    'title': article.get('title', ''),
-                    'description': article.get('description', ''),
-                    'url': article.get('url', ''),
-                    'published_at': article.get('publishedAt', ''),
-                    'source_name': article.get('source', {}).get('name', '')
-                })
-            return articles
-            
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, ValueError) as e:
             return [{"error": f"Failed to fetch from NewsAPI: {str(e)}"}]
     
     def fetch_guardian(self, query: str = "investment", from_date: str = None, to_date: str = None) -> List[Dict]:
@@ -79,40 +459,14 @@ class NewsFetcher:
         Returns:
             List of news articles
         """
-        url = "https://content.guardianapis.com/search"
-        params = {
-            'q': f"{query} funding venture capital startup Bitcoin cryptocurrency stock market economy",
-            'show-fields': 'headline,trailText,webUrl,publication',
-            'api-key': self.api_key if self.api_key else 'test',  # test key works for limited requests
-            'page-size': 50,
-            'section': 'business'
-        }
-        
-        # Add date filters if provided
-        if from_date:
-            params['from-date'] = from_date
-        if to_date:
-            params['to-date'] = to_date
+        params = self._guardian_params(query, from_date, to_date)
         
         try:
-            response = requests.get(url, params=params)
+            response = self.session.get(GUARDIAN_URL, params=params, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
-            data = response.json()
-            
-            articles = []
-            for article in data.get('response', {}).get('results', []):
-                fields = article.get('fields', {})
-                articles.append({
-                    'source': 'The Guardian',
-                    'title': fields.get('headline', ''),
-                    'description': fields.get('trailText', ''),
-                    'url': fields.get('webUrl', ''),
-                    'published_at': article.get('webPublicationDate', ''),
-                    'source_name': 'The Guardian'
-                })
-            return articles
+            return self._parse_guardian(json_loads(response.content))
             
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, ValueError) as e:
             return [{"error": f"Failed to fetch from The Guardian: {str(e)}"}]
     
     def fetch_reddit_news(self, subreddit: str = "investing", limit: int = 50) -> List[Dict]:
@@ -120,42 +474,31 @@ class NewsFetcher:
         Fetch news from Reddit (public API, no authentication required)
         
         Args:
-            subreddit: Subreddit to fetch from
+            subreddit: Subreddit to fetch from; several can be joined with '+'
             limit: Number of posts to fetch
             
         Returns:
             List of news articles
         """
-        url = f"https://www.reddit.com/r/{subreddit}/hot.json"
-        headers = {'User-Agent': 'NewsFetcher/1.0'}
-        
         try:
-            response = requests.get(url, headers=headers, params={'limit': limit})
-            response.raise_for_status()
-            data = response.json()
-            
-            articles = []
-            for post in data.get('data', {}).get('children', []):
-                post_data = post.get('data', {})
-                # Filter for investment-related content
-                title = post_data.get('title', '').lower()
-                investment_keywords = ['investment', 'funding', 'venture', 'capital', 'startup', 'ipo', 'acquisition', 'merger', 'fund', 'raise', 'bitcoin', 'crypto', 'cryptocurrency', 'btc', 'blockchain', 'stock', 'market', 'economy', 'financial', 'finance']
-                
-                if any(keyword in title for keyword in investment_keywords):
-                    articles.append({
-                        'source': 'Reddit',
-                        'title': post_data.get('title', ''),
-                        'description': post_data.get('selftext', ''),
-                        'url': post_data.get('url', ''),
-                        'published_at': datetime.fromtimestamp(post_data.get('created_utc', 0)).isoformat(),
-                        'source_name': f'r/{subreddit}',
-                        'score': post_data.get('score', 0)
-                    })
-            return articles
+            return self._parse_reddit(self._fetch_reddit_raw(subreddit, limit), subreddit)
             
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, ValueError) as e:
             return [{"error": f"Failed to fetch from Reddit: {str(e)}"}]
     
+    def fetch_reddit_multi(self, subreddits: List[str] = REDDIT_SUBREDDITS, limit: int = REDDIT_MULTI_LIMIT) -> List[Dict]:
+        """
+        Fetch news from several subreddits in a single request via /r/a+b+c/hot.json
+        
+        Args:
+            subreddits: Subreddits to fetch from
+            limit: Number of posts to fetch across all subreddits
+            
+        Returns:
+            List of news articles
+        """
+        return self.fetch_reddit_news('+'.join(subreddits), limit)
+    
     def fetch_all_news(self, query: str = "investment", from_date: str = None, to_date: str = None) -> List[Dict]:
         """
         Fetch investment news from multiple sources
@@ -168,151 +511,266 @@ class NewsFetcher:
         Returns:
             Combined list of news articles from all sources
         """
-        all_articles = []
+        # Fetch from multiple sources concurrently
+        with ThreadPoolExecutor(max_workers=SOURCE_WORKERS) as executor:
+            futures = [executor.submit(self.fetch_reddit_multi)]
+            futures.extend(executor.submit(source, query, from_date=from_date, to_date=to_date)
+                           for source in self._search_sources)
+            
+            return self._merge_results(article for future in as_completed(futures) for article in future.result())
+    
+    def _merge_results(self, all_articles: Iterable[Dict]) -> List[Dict]:
+        """Drop error entries and sort articles by published date (newest first)"""
+        # Filter out error responses while sorting, without an intermediate list
+        return sorted((article for article in all_articles if 'error' not in article), key=_get_pub, reverse=True)
+    
+    def _create_async_session(self) -> "aiohttp.ClientSession":
+        """Create an aiohttp session with pooled keep-alive connections"""
+        if aiohttp is None:
+            raise ImportError("aiohttp is required for async fetching. Install it with 'pip install aiohttp'")
+        
+        connector = aiohttp.TCPConnector(limit=100, limit_per_host=10, keepalive_timeout=60)
+        timeout = aiohttp.ClientTimeout(sock_connect=REQUEST_TIMEOUT[0], sock_read=REQUEST_TIMEOUT[1])
+        return aiohttp.ClientSession(connector=connector, timeout=timeout,
+                                     headers={'User-Agent': 'NewsFetcher/1.0'})
+    
+    async def _get_json_async(self, session: "aiohttp.ClientSession", url: str, params: Dict) -> Dict:
+        """GET a URL with the given session and decode the JSON body"""
+        async with session.get(url, params=params) as response:
+            response.raise_for_status()
+            return json_loads(await response.read())
+    
+    async def fetch_news_api_async(self, session: "aiohttp.ClientSession", query: str = "investment", language: str = "en", from_date: str = None, to_date: str = None) -> List[Dict]:
+        """
+        Async variant of fetch_news_api using a shared aiohttp session
+        
+        Args:
+            session: aiohttp session to issue the request with
+            query: Search query for news
+            language: Language code (en, es, fr, etc.)
+            from_date: Start date in YYYY-MM-DD format
+            to_date: End date in YYYY-MM-DD format
+            
+        Returns:
+            List of news articles
+        """
+        if not self.api_key:
+            return [{"error": "API key required for NewsAPI. Get one from newsapi.org"}]
+        
+        params = self._news_api_params(query, language, from_date, to_date)
+        
+        try:
+            return self._parse_news_api(await self._get_json_async(session, NEWS_API_URL, params))
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            return [{"error": f"Failed to fetch from NewsAPI: {str(e)}"}]
+    
+    async def fetch_guardian_async(self, session: "aiohttp.ClientSession", query: str = "investment", from_date: str = None, to_date: str = None) -> List[Dict]:
+        """
+        Async variant of fetch_guardian using a shared aiohttp session
+        
+        Args:
+            session: aiohttp session to issue the request with
+            query: Search query for news
+            from_date: Start date in YYYY-MM-DD format
+            to_date: End date in YYYY-MM-DD format
+            
+        Returns:
+            List of news articles
+        """
+        params = self._guardian_params(query, from_date, to_date)
         
-        # Fetch from multiple sources
-        all_articles.extend(self.fetch_guardian(query, from_date, to_date))
-        all_articles.extend(self.fetch_reddit_news("investing"))
-        all_articles.extend(self.fetch_reddit_news("stocks"))
-        all_articles.extend(self.fetch_reddit_news("Bitcoin"))
-        all_articles.extend(self.fetch_reddit_news("CryptoCurrency"))
-        all_articles.extend(self.fetch_reddit_news("worldnews"))
-        all_articles.extend(self.fetch_reddit_news("news"))
+        try:
+            return self._parse_guardian(await self._get_json_async(session, GUARDIAN_URL, params))
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            return [{"error": f"Failed to fetch from The Guardian: {str(e)}"}]
+    
+    async def _fetch_reddit_raw_async(self, session: "aiohttp.ClientSession", subreddit: str, limit: int) -> Dict:
+        """Async counterpart of _fetch_reddit_raw's network path; fills the listing cache"""
+        data = await self._get_json_async(session, REDDIT_URL.format(subreddit=subreddit), {**REDDIT_PARAMS, 'limit': limit})
+        data = _prune_reddit_listing(data)
+        self._store_cached_reddit((subreddit, limit), data)
+        return data
+    
+    async def fetch_reddit_news_async(self, session: "aiohttp.ClientSession", subreddit: str = "investing", limit: int = 50) -> List[Dict]:
+        """
+        Async variant of fetch_reddit_news using a shared aiohttp session
         
-        # Only fetch from NewsAPI if API key is provided
-        if self.api_key:
-            all_articles.extend(self.fetch_news_api(query, from_date=from_date, to_date=to_date))
+        Args:
+            session: aiohttp session to issue the request with
+            subreddit: Subreddit to fetch from
+            limit: Number of posts to fetch
+            
+        Returns:
+            List of news articles
+        """
+        key = (subreddit, limit)
         
-        # Filter out error responses and sort by date (newest first)
-        valid_articles = [article for article in all_articles if 'error' not in article]
+        try:
+            data = self._get_cached_reddit(key)
+            if data is None:
+                task = self._reddit_async_fetches.get(key)
+                if task is None:
+                    task = asyncio.ensure_future(self._fetch_reddit_raw_async(session, subreddit, limit))
+                    self._reddit_async_fetches[key] = task
+                    task.add_done_callback(lambda _: self._reddit_async_fetches.pop(key, None))
+                # Shield so one cancelled waiter does not cancel the shared fetch
+                data = await asyncio.shield(task)
+            return self._parse_reddit(data, subreddit)
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            return [{"error": f"Failed to fetch from Reddit: {str(e)}"}]
+    
+    async def fetch_all_news_async(self, session: "aiohttp.ClientSession", query: str = "investment", from_date: str = None, to_date: str = None) -> List[Dict]:
+        """
+        Async variant of fetch_all_news; all sources are requested concurrently
         
-        # Sort by published date (newest first)
-        valid_articles.sort(key=lambda x: x.get('published_at', ''), reverse=True)
+        Args:
+            session: aiohttp session to issue the requests with
+            query: Search query for news (default: investment)
+            from_date: Start date in YYYY-MM-DD format
+            to_date: End date in YYYY-MM-DD format
+            
+        Returns:
+            Combined list of news articles from all sources
+        """
+        coros = [self.fetch_reddit_news_async(session, '+'.join(REDDIT_SUBREDDITS), REDDIT_MULTI_LIMIT)]
+        coros.extend(source(session, query, from_date=from_date, to_date=to_date)
+                     for source in self._async_search_sources)
         
-        return valid_articles
+        results = await asyncio.gather(*coros, return_exceptions=True)
+        return self._merge_results(article for result in results
+                                   if not isinstance(result, BaseException) for article in result)
+    
+    def _year_range(self, year: int):
+        """(from_date, to_date) covering a calendar year, in YYYY-MM-DD format"""
+        return f"{year}-01-01", f"{year}-12-31"
     
-    def fetch_major_news_2018_to_today(self) -> List[Dict]:
+    def _fetch_years(self, query: str, years: List[int]) -> List[List[Dict]]:
+        """
+        Run fetch_all_news for one query over several years concurrently
+        
+        Args:
+            query: Search query for news
+            years: Years to fetch, one request set per year
+            
+        Returns:
+            Article lists in the same order as years
+        """
+        with ThreadPoolExecutor(max_workers=YEAR_WORKERS) as executor:
+            return list(executor.map(lambda year: self.fetch_all_news(query, *self._year_range(year)), years))
+    
+    def fetch_major_news_2018_to_today(self, use_async: bool = False) -> List[Dict]:
         """
         Fetch major news from 2018 to today with even distribution across years
         
+        Args:
+            use_async: Fetch with aiohttp on an event loop instead of thread pools
+        
         Returns:
             List of major news articles from 2018 to present (100+ articles)
         """
-        current_year = datetime.now().year
-        years = list(range(2018, current_year + 1))
+        if use_async:
+            return asyncio.run(self.fetch_major_news_2018_to_today_async())
+        return self._collect_major_news(self._fetch_years)
+    
+    async def fetch_major_news_2018_to_today_async(self) -> List[Dict]:
+        """
+        Async variant of fetch_major_news_2018_to_today
         
-        # Calculate target articles per year (at least 20 per year for 100+ total)
-        target_per_year = max(20, 100 // len(years))
+        All years of a query are requested concurrently on one event loop, with
+        at most ASYNC_QUERY_CONCURRENCY queries in flight to respect API rate
+        limits. As in the sync version, the additional queries are only sent
+        when the major news queries yield fewer than 100 articles.
         
-        all_major_articles = []
-        
-        # Major news queries covering different categories
-        major_news_queries = [
-            "politics",
-            "economy",
-            "technology",
-            "business",
-            "finance",
-            "world news",
-            "breaking news",
-            "stock market",
-            "cryptocurrency",
-            "climate change",
-            "health",
-            "science",
-            "artificial intelligence",
-            "space",
-            "entertainment",
-            "sports",
-            "environment",
-            "education",
-            "innovation",
-            "global economy"
-        ]
-        
-        # Fetch articles for each year
-        for year in years:
-            print(f"\nFetching news for year {year}...")
-            year_articles = []
+        Returns:
+            List of major news articles from 2018 to present (100+ articles)
+        """
+        years = self._archive_years()
+        semaphore = asyncio.Semaphore(ASYNC_QUERY_CONCURRENCY)
+        
+        async with self._create_async_session() as session:
+            async def fetch_year(query, year):
+                async with semaphore:
+                    return await self.fetch_all_news_async(session, query, *self._year_range(year))
             
-            # Define date range for this year
-            from_date = f"{year}-01-01"
-            to_date = f"{year}-12-31"
+            async def fetch_years(query, years):
+                return await asyncio.gather(*(fetch_year(query, year) for year in years))
             
-            # Try different queries until we get enough articles for this year
-            for query in major_news_queries:
-                if len(year_articles) >= target_per_year:
-                    break
-                    
-                print(f"  Querying: {query}")
-                articles = self.fetch_all_news(query, from_date, to_date)
-                
-                # Filter out duplicates within this year
-                seen_titles = set(article.get('title', '').lower() for article in year_articles)
-                for article in articles:
-                    if len(year_articles) >= target_per_year:
-                        break
-                    title = article.get('title', '').lower()
-                    if title and title not in seen_titles:
-                        year_articles.append(article)
-                        seen_titles.add(title)
+            seen_titles = set()
+            print(f"\nFetching major news for {years[0]}-{years[-1]}...")
+            unique_articles = self._select_major_news(years, await fetch_years(MAJOR_NEWS_QUERY, years), seen_titles)
             
-            print(f"  Collected {len(year_articles)} articles for {year}")
-            all_major_articles.extend(year_articles)
+            # If we don't have enough articles, try to fetch more from recent years
+            if len(unique_articles) < 100:
+                print("Fetching additional articles to reach 100+...")
+                for articles in await fetch_years(ADDITIONAL_QUERY, years[-3:]):
+                    add_unique_articles(articles, unique_articles, seen_titles, 100)
         
-        # Remove duplicates across all years
-        seen_titles = set()
-        unique_articles = []
+        return self._finish_major_news(unique_articles)
+    
+    def _archive_years(self) -> List[int]:
+        """Years covered by the major news archive"""
+        current_year = datetime.now().year
+        return list(range(2018, current_year + 1))
+    
+    def _collect_major_news(self, fetch_years) -> List[Dict]:
+        """
+        Select an evenly distributed set of major news articles across years
         
-        for article in all_major_articles:
-            title = article.get('title', '').lower()
-            if title and title not in seen_titles:
-                seen_titles.add(title)
-                unique_articles.append(article)
+        Args:
+            fetch_years: Callable taking (query, years) and returning one
+                article list per year, in the same order
+            
+        Returns:
+            List of major news articles from 2018 to present (100+ articles)
+        """
+        years = self._archive_years()
         
-        # Sort by date and ensure we have at least 100 articles
-        unique_articles.sort(key=lambda x: x.get('published_at', ''), reverse=True)
+        # Normalized title keys of every article kept so far, shared across years
+        # so duplicates are dropped as they arrive instead of in a later pass
+        seen_titles = set()
         
-        print(f"\nTotal unique articles collected: {len(unique_articles)}")
+        # Query all major news topics at once, for every year concurrently
+        print(f"\nFetching major news for {years[0]}-{years[-1]}...")
+        unique_articles = self._select_major_news(years, fetch_years(MAJOR_NEWS_QUERY, years), seen_titles)
         
         # If we don't have enough articles, try to fetch more from recent years
         if len(unique_articles) < 100:
             print("Fetching additional articles to reach 100+...")
-            additional_queries = [
-                "technology news",
-                "business news",
-                "financial news",
-                "world events",
-                "major announcements"
-            ]
-            
             # Focus on recent years for additional articles
-            recent_years = years[-3:]  # Last 3 years
+            for articles in fetch_years(ADDITIONAL_QUERY, years[-3:]):
+                add_unique_articles(articles, unique_articles, seen_titles, 100)
+        
+        return self._finish_major_news(unique_articles)
+    
+    def _select_major_news(self, years: List[int], year_results: List[List[Dict]], seen_titles: set) -> List[Dict]:
+        """
+        Take up to a per-year target of unseen articles from each year's results
+        
+        Args:
+            years: Years covered by the archive
+            year_results: Article lists for the major news query, one per year
+            seen_titles: Hashes of normalized titles already accepted; updated in place
             
-            for year in recent_years:
-                if len(unique_articles) >= 100:
-                    break
-                    
-                from_date = f"{year}-01-01"
-                to_date = f"{year}-12-31"
-                
-                for query in additional_queries:
-                    if len(unique_articles) >= 100:
-                        break
-                        
-                    articles = self.fetch_all_news(query, from_date, to_date)
-                    seen_titles = set(article.get('title', '').lower() for article in unique_articles)
-                    
-                    for article in articles:
-                        if len(unique_articles) >= 100:
-                            break
-                        title = article.get('title', '').lower()
-                        if title and title not in seen_titles:
-                            unique_articles.append(article)
-                            seen_titles.add(title)
+        Returns:
+            Selected articles, grouped by year
+        """
+        # Calculate target articles per year (at least 20 per year for 100+ total)
+        target_per_year = max(20, 100 // len(years))
         
+        unique_articles = []
+        for year, articles in zip(years, year_results):
+            year_articles = []
+            add_unique_articles(articles, year_articles, seen_titles, target_per_year)
+            print(f"  Collected {len(year_articles)} articles for {year}")
+            unique_articles.extend(year_articles)
+        
+        print(f"\nTotal unique articles collected: {len(unique_articles)}")
+        return unique_articles
+    
+    def _finish_major_news(self, unique_articles: List[Dict]) -> List[Dict]:
+        """Sort the archive newest first and report its distribution by year"""
         # Final sort by date
-        unique_articles.sort(key=lambda x: x.get('published_at', ''), reverse=True)
+        unique_articles.sort(key=_get_pub, reverse=True)
         
         print(f"Final article count: {len(unique_articles)}")
         
@@ -333,7 +791,7 @@ class NewsFetcher:
         
         return unique_articles
     
-    def save_news_to_csv(self, articles: List[Dict], filename: str = "major_news_2018_to_today.csv") -> str:
+    def save_news_to_csv(self, articles: List[Dict], filename: str = CSV_FILENAME) -> str:
         """
         Save news articles to CSV file
         
@@ -350,16 +808,10 @@ class NewsFetcher:
         # Prepare data for CSV
         data = []
         for article in articles:
-            # Parse and format date
+            # Format ISO timestamps as "YYYY-MM-DD HH:MM:SS", keep anything else as-is
             published_at = article.get('published_at', '')
-            try:
-                if 'T' in published_at:
-                    date_obj = datetime.fromisoformat(published_at.replace('Z', '+00:00'))
-                    formatted_date = date_obj.strftime("%Y-%m-%d %H:%M:%S")
-                else:
-                    formatted_date = published_at
-            except:
-                formatted_date = published_at
+            match = _ISO_RE.match(published_at)
+            formatted_date = f"{match.group(1)} {match.group(2)}" if match else published_at
             
             data.append({
                 'Date': formatted_date,
@@ -370,12 +822,100 @@ class NewsFetcher:
                 'URL': article.get('url', '')
             })
         
-        # Create DataFrame and save to CSV
-        df = pd.DataFrame(data)
-        df.to_csv(filename, index=False)
+        with open(filename, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=CSV_FIELDNAMES)
+            writer.writeheader()
+            writer.writerows(data)
         return filename
 
 
+# (path, mtime) -> ETag of the archive file last served
+_csv_etags = {}
+
+
+def _csv_age(csv_file: str) -> Optional[float]:
+    """Seconds since the archive was last written, or None if it does not exist"""
+    if not os.path.exists(csv_file):
+        return None
+    return time.time() - os.path.getmtime(csv_file)
+
+
+def _regenerate_csv(csv_file: str) -> bool:
+    """
+    Rebuild the archive CSV
+    
+    The new file is written next to the old one and swapped in atomically, so
+    readers never see a partially written archive.
+    
+    Returns:
+        True if the archive was replaced
+    """
+    tmp_file = f"{csv_file}.tmp"
+    with NewsFetcher() as fetcher:
+        articles = fetcher.fetch_major_news_2018_to_today()
+        if fetcher.save_news_to_csv(articles, tmp_file):
+            os.replace(tmp_file, csv_file)
+            return True
+    return False
+
+
+def start_background_refresh(csv_file: str = CSV_FILENAME, interval: int = CSV_MAX_AGE // 2) -> threading.Thread:
+    """
+    Keep the archive fresh from a daemon thread
+    
+    The archive is built right away if it is missing or older than interval,
+    then rebuilt every interval seconds. A failed rebuild is retried after
+    CSV_RETRY_BACKOFF seconds, doubling up to interval while it keeps failing.
+    This is the only place the archive is rebuilt while serving: under
+    gunicorn it runs once, in the master process (see gunicorn.conf.py), and
+    workers only serve the file.
+    
+    Args:
+        csv_file: Path of the archive CSV
+        interval: Seconds between rebuilds; shorter than CSV_MAX_AGE so clients
+            never receive an archive past its advertised max-age
+        
+    Returns:
+        The started thread
+    """
+    def refresh_loop():
+        backoff = CSV_RETRY_BACKOFF
+        while True:
+            age = _csv_age(csv_file)
+            if age is None or age >= interval:
+                try:
+                    rebuilt = _regenerate_csv(csv_file)
+                except Exception as e:
+                    print(f"Background refresh of {csv_file} failed: {e}")
+                    rebuilt = False
+                if rebuilt:
+                    backoff = CSV_RETRY_BACKOFF
+                    wait = interval
+                else:
+                    # Keep serving the old archive and retry after the backoff
+                    wait = min(backoff, interval)
+                    backoff = min(backoff * 2, interval)
+            else:
+                wait = interval - age
+            time.sleep(wait)
+    
+    thread = threading.Thread(target=refresh_loop, name="csv-refresh", daemon=True)
+    thread.start()
+    return thread
+
+
+def _csv_etag(csv_file: str) -> str:
+    """SHA-1 of the archive contents, computed once per file version"""
+    key = (csv_file, os.path.getmtime(csv_file))
+    etag = _csv_etags.get(key)
+    if etag is None:
+        with open(csv_file, 'rb') as f:
+            etag = hashlib.sha1(f.read()).hexdigest()
+        _csv_etags.clear()
+        _csv_etags[key] = etag
+    return etag
+
+
 def create_web_server():
     """Create and run Flask web server with download link"""
     app = Flask(__name__)
@@ -421,33 +961,58 @@ def create_web_server():
     
     @app.route('/download')
     def download_file():
-        # Generate the CSV file if it doesn't exist
-        csv_file = "major_news_2018_to_today.csv"
+        # The archive is built by the background refresher, never per request.
+        # send_file resolves relative paths against the app's root, not the
+        # cwd the refresher writes to, so pass an absolute path.
+        csv_file = os.path.abspath(CSV_FILENAME)
         if not os.path.exists(csv_file):
-            fetcher = NewsFetcher()
-            articles = fetcher.fetch_major_news_2018_to_today()
-            fetcher.save_news_to_csv(articles, csv_file)
+            return ("The news archive is being generated, please try again shortly.",
+                    503, {'Retry-After': str(CSV_RETRY_AFTER)})
         
-        return send_file(csv_file, as_attachment=True)
+        # Conditional requests with a matching ETag get a 304 without the body
+        return send_file(csv_file, as_attachment=True, conditional=True,
+                         etag=_csv_etag(csv_file), max_age=CSV_MAX_AGE)
     
     return app
 
 
+def serve(host: str = '0.0.0.0', port: int = 8080):
+    """
+    Serve the web app with gunicorn, falling back to Flask's threaded server
+    
+    gunicorn replaces the current process (so it receives signals directly)
+    and is configured by gunicorn.conf.py, whose master process runs the
+    archive refresher. gunicorn is unavailable on Windows, where the refresher
+    is started here and the Werkzeug server is used with threading enabled.
+    """
+    gunicorn = shutil.which('gunicorn')
+    if gunicorn:
+        os.execv(gunicorn, [
+            gunicorn,
+            '--config', GUNICORN_CONFIG,
+            '--bind', f'{host}:{port}',
+            'news_fetcher:create_web_server()'
+        ])
+    else:
+        start_background_refresh()
+        app = create_web_server()
+        app.run(host=host, port=port, debug=False, threaded=True)
+
+
 def main():
     """Main function to fetch news and start web server"""
     print("Starting Major News Fetcher (2018-Today)...")
     print("Fetching 100+ articles evenly distributed across years...")
     
     # Initialize fetcher
-    fetcher = NewsFetcher()
-    
-    # Fetch major news from 2018 to today
-    print("Fetching major news from 2018 to today...")
-    articles = fetcher.fetch_major_news_2018_to_today()
-    
-    # Save to CSV
-    print(f"Saving {len(articles)} articles to CSV...")
-    csv_file = fetcher.save_news_to_csv(articles)
+    with NewsFetcher() as fetcher:
+        # Fetch major news from 2018 to today
+        print("Fetching major news from 2018 to today...")
+        articles = fetcher.fetch_major_news_2018_to_today()
+        
+        # Save to CSV
+        print(f"Saving {len(articles)} articles to CSV...")
+        csv_file = fetcher.save_news_to_csv(articles)
     
     if csv_file:
         print(f"CSV file created: {csv_file}")
@@ -456,8 +1021,7 @@ def main():
         print("Starting web server on port 8080...")
         print("Visit http://localhost:8080 to download the CSV file")
         
-        app = create_web_server()
-        app.run(host='0.0.0.0', port=8080, debug=False)
+        serve(host='0.0.0.0', port=8080)
     else:
         print("Failed to create CSV file")
 